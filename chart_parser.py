@@ -0,0 +1,175 @@
+"""
+Chart text parser for the Selenium scraper.
+
+Turns the visible text of an artificialanalysis.ai chart into ranked
+models. Kept free of Selenium and I/O, with full type annotations, so it
+can optionally be compiled for speed:
+
+    pip install mypy
+    mypyc chart_parser.py
+
+The compiled extension is picked up by the normal import; without it the
+pure-Python module is used.
+"""
+
+import functools
+import re
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import ahocorasick  # type: ignore  # Optional: faster ignore-pattern matching
+except ImportError:
+    ahocorasick = None
+
+
+def _build_ignore_matcher(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a function telling whether text contains any of the patterns.
+    
+    Uses a single Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise one precompiled alternation regex.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    regex = re.compile("|".join(re.escape(pattern) for pattern in patterns))
+    return lambda text: regex.search(text) is not None
+
+
+# Text to ignore (UI elements, navigation, descriptions)
+# Use word boundaries or full phrases to avoid partial matches
+IGNORE_PATTERNS = (
+    'add model', 'specific provider', 'artificial analysis', 
+    'benchmark', 'leaderboard', 'filter',
+    'incorporates', 'evaluations', 'represents', 'average',
+    'open weights', 'proprietary', 'non-reasoning',
+    'coding index', 'agentic index', 'intelligence index', 
+    'click here', 'select', 'compare models', 'view all', 
+    'show more', 'hide', 'show less',
+    'subscribe', 'newsletter', 'contact us', 'about us', 'privacy',
+    'terms of', 'cookie', 'sign in', 'log in', 'register'
+)
+_contains_ignored = _build_ignore_matcher(IGNORE_PATTERNS)
+
+# Precompiled patterns for the per-line classifiers
+_RE_OF_MODELS = re.compile(r'^\d+\s+of\s+\d+\s+models?$')
+_RE_NAME_OK = re.compile(r'^[\w\s\-\.\(\)]+$', re.UNICODE)
+_RE_SCORE = re.compile(r'^\d{1,2}$')
+
+
+# The classifiers are pure functions of the line text, and the same lines
+# (model names, scores) recur on every check, so their results are memoized
+@functools.lru_cache(maxsize=4096)
+def is_model_name(text: str) -> bool:
+    """
+    Check if text looks like an AI model name.
+    Uses heuristics instead of keyword matching to handle new/unknown models.
+    """
+    if not text or len(text) < 2 or len(text) > 80:
+        return False
+    
+    text_lower = text.lower().strip()
+    
+    # Check if it's UI text to ignore
+    if _contains_ignored(text_lower):
+        return False
+    
+    # Reject "X of Y models" patterns (e.g., "25 of 342 models", "25 of 345 models")
+    if _RE_OF_MODELS.match(text_lower):
+        return False
+    
+    # Reject common UI patterns
+    if text.startswith(('+', '×', '•', '→', '←', '↑', '↓')):
+        return False
+    
+    # Reject if it's just a number or very short
+    if text.isdigit() or len(text_lower) < 2:
+        return False
+    
+    # Reject if it looks like a sentence (too many spaces, ends with punctuation)
+    if text.count(' ') > 6:
+        return False
+    if text.endswith(('.', '!', '?', ':')):
+        return False
+    
+    # Reject pure URLs
+    if text_lower.startswith(('http://', 'https://', 'www.')):
+        return False
+    
+    # Model names typically have:
+    # - Alphanumeric characters with optional hyphens, underscores, dots
+    # - Version numbers (1.5, 2.0, v2, etc.)
+    # - Size indicators (7B, 70B, etc.)
+    
+    # Check if it matches typical model name patterns
+    # Allow: letters, numbers, spaces, hyphens, underscores, dots, parentheses
+    if not _RE_NAME_OK.match(text):
+        return False
+    
+    # Must contain at least one letter
+    if not any(c.isalpha() for c in text):
+        return False
+    
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def is_score(text: str) -> Optional[int]:
+    """Check if text is a valid score (10-99)."""
+    if _RE_SCORE.match(text.strip()):
+        score = int(text.strip())
+        if 10 <= score <= 99:
+            return score
+    return None
+
+
+# Precompiled cleanup for model names
+_EMOJI_TABLE: Dict[int, None] = dict.fromkeys(range(0x1F300, 0x1FA00))  # str.translate deletion map
+_RE_WS = re.compile(r'\s+')
+
+
+def parse_chart_text(text: str, limit: int = 25) -> List[Dict[str, Union[int, str]]]:
+    """Extract ranked models from the page text of a chart.
+    
+    Single pass: find the first "25 of 34X models" marker, then classify
+    each chart line as it is read - models come first, then scores.
+    """
+    in_chart: bool = False
+    names: List[str] = []
+    scores: List[int] = []
+    
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        
+        # Look for the models count marker (e.g., "25 of 345 models")
+        if _RE_OF_MODELS.match(line.lower()):
+            in_chart = True
+            continue
+        
+        # Skip empty lines, "+ Add model" and the "Artificial Analysis" label
+        if not in_chart or not line or "+ Add model" in line or line == "Artificial Analysis":
+            continue
+        
+        # End at JSON schema data
+        if '{"@context"' in line:
+            break
+        
+        score = is_score(line)
+        if score:
+            scores.append(score)
+            continue
+        
+        # Strip emoji badges before classifying, the name check rejects them
+        clean = _RE_WS.sub(' ', line.translate(_EMOJI_TABLE)).strip()
+        if len(clean) > 2 and is_model_name(clean):
+            names.append(clean)
+    
+    # Match names with scores (they appear in same order)
+    # Limit to 25 models (the chart shows 25)
+    return [
+        {"rank": i + 1, "model": name, "score": score}
+        for i, (name, score) in enumerate(zip(names[:limit], scores[:limit]))
+    ]
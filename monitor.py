@@ -1,25 +1,33 @@
 """
 Artificial Analysis Benchmark Monitor - Simple Version
 
-Scrapes benchmark indices from artificialanalysis.ai using Selenium.
+Scrapes benchmark indices from artificialanalysis.ai, reading the JSON embedded
+in the page and falling back to Selenium when that is unavailable.
 Monitors for changes and sends Pushover notifications.
 
 Usage:
     python monitor.py              # Run continuously (every 30 min)
     python monitor.py --once       # Run once and exit
     python monitor.py --interval 15  # Check every 15 minutes
+    python monitor.py --selenium   # Always scrape with headless Chrome
 """
 
-import json
 import time
+import hashlib
 import re
 import os
 import logging
+import signal
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from chart_parser import parse_chart_text
+
 import ssl
 import certifi
 import urllib3
@@ -33,19 +41,17 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 # Fix SSL certificate issues for all requests
 os.environ['SSL_CERT_FILE'] = certifi.where()
 os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
-os.environ['WDM_SSL_VERIFY'] = '0'  # Disable SSL verify for webdriver-manager
 
 try:
+    import orjson
     from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import TimeoutException, WebDriverException
     from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
 except ImportError:
     print("Required packages not installed. Run:")
-    print("pip install selenium webdriver-manager requests schedule certifi")
+    print("pip install selenium requests orjson certifi")
     exit(1)
 
 # ============================================================================
@@ -56,8 +62,24 @@ PUSHOVER_USER_KEY = os.getenv("PUSHOVER_USER_KEY", "")
 PUSHOVER_API_TOKEN = os.getenv("PUSHOVER_API_TOKEN", "")  # CREATE YOUR APP AT https://pushover.net/apps/build - leave empty to skip notifications
 SCRAPE_INTERVAL_MINUTES = 30
 DATA_FILE = "benchmark_data.json"
-HISTORY_FILE = "benchmark_history.json"
+HISTORY_FILE = "benchmark_history.jsonl"  # One snapshot per line, append-only
+LEGACY_HISTORY_FILE = "benchmark_history.json"  # Old single-array format, migrated on startup
+HISTORY_MAX_BYTES = 5 * 1024 * 1024  # Rotate the history file beyond this size
+PAGE_STATE_FILE = "page_state.json"  # HTTP validators from the last successful check
 BASE_URL = "https://artificialanalysis.ai/"
+SCREENSHOT_FILE = "latest_scrape.png"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+CHROME_PROFILE_DIR = ".chrome-profile"  # Persistent Chrome profiles (HTTP cache) per tab
+
+def _dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson keeps non-ASCII text as-is)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option)
+
+
+_load_json = orjson.loads
 
 # ============================================================================
 # LOGGING SETUP
@@ -85,13 +107,18 @@ class ScrapeError(RuntimeError):
 # PUSHOVER NOTIFICATIONS
 # ============================================================================
 
+# Shared session so repeated Pushover calls reuse one keep-alive TLS connection
+_PUSHOVER_SESSION = requests.Session()
+_PUSHOVER_SESSION.headers.update({"User-Agent": "aa-monitor/1.0"})
+_PUSHOVER_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
 def validate_pushover_credentials() -> bool:
     """Validate Pushover API credentials. Raises exception if invalid."""
     if not PUSHOVER_USER_KEY or not PUSHOVER_API_TOKEN:
         raise PushoverError("PUSHOVER_USER_KEY and PUSHOVER_API_TOKEN must be set")
     
     try:
-        response = requests.post(
+        response = _PUSHOVER_SESSION.post(
             "https://api.pushover.net/1/users/validate.json",
             data={
                 "token": PUSHOVER_API_TOKEN,
@@ -118,7 +145,6 @@ def send_pushover(title: str, message: str, priority: int = 0, image_path: str =
     if not PUSHOVER_API_TOKEN or not PUSHOVER_USER_KEY:
         raise PushoverError("Pushover credentials missing. Unable to send notification.")
         
-    attachment_handle = None
     files = None
     try:
         data = {
@@ -131,15 +157,15 @@ def send_pushover(title: str, message: str, priority: int = 0, image_path: str =
         
         if image_path and os.path.exists(image_path):
             try:
-                attachment_handle = open(image_path, "rb")
-                files = {
-                    "attachment": ("benchmark.png", attachment_handle, "image/png")
-                }
+                with open(image_path, "rb") as fh:
+                    files = {
+                        "attachment": ("benchmark.png", fh.read(), "image/png")
+                    }
                 logger.info(f"Attaching image: {image_path}")
             except OSError as exc:
                 raise PushoverError(f"Failed to attach image: {exc}") from exc
         
-        response = requests.post(
+        response = _PUSHOVER_SESSION.post(
             "https://api.pushover.net/1/messages.json",
             data=data,
             files=files,
@@ -153,36 +179,93 @@ def send_pushover(title: str, message: str, priority: int = 0, image_path: str =
             
     except requests.exceptions.RequestException as e:
         raise PushoverError(f"Pushover request failed: {e}") from e
-    finally:
-        if attachment_handle:
-            attachment_handle.close()
 
 # ============================================================================
 # SCRAPER
 # ============================================================================
 
+def _try_lock(handle) -> bool:
+    """Take a non-blocking exclusive lock on an open file. False if already held."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
 class BenchmarkScraper:
     """Scrapes benchmark data from artificialanalysis.ai"""
     
-    # Text to ignore (UI elements, navigation, descriptions)
-    # Use word boundaries or full phrases to avoid partial matches
-    IGNORE_PATTERNS = [
-        'add model', 'specific provider', 'artificial analysis', 
-        'benchmark', 'leaderboard', 'filter',
-        'incorporates', 'evaluations', 'represents', 'average',
-        'open weights', 'proprietary', 'non-reasoning',
-        'coding index', 'agentic index', 'intelligence index', 
-        'click here', 'select', 'compare models', 'view all', 
-        'show more', 'hide', 'show less',
-        'subscribe', 'newsletter', 'contact us', 'about us', 'privacy',
-        'terms of', 'cookie', 'sign in', 'log in', 'register'
-    ]
+    # Precompiled patterns for chart extraction
+    _RE_MODELS_MARKER = re.compile(r'^\s*\d+\s+of\s+\d+\s+models?\s*$', re.M | re.I)
+    _RE_WS = re.compile(r'\s+')
+    _RE_NON_ALPHA = re.compile(r'[^a-z]')
+    
+    # Embedded JSON blocks that carry the page data (Next.js payload and JSON-LD)
+    NEXT_DATA_RE = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+    JSON_LD_RE = re.compile(r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.S)
+    
+    # Normalized key suffixes identifying each index's score in a model record
+    # (matches e.g. "codingIndex" and "artificial_analysis_coding_index")
+    INDEX_KEYS = {
+        "intelligence_index": "intelligenceindex",
+        "coding_index": "codingindex",
+        "agentic_index": "agenticindex"
+    }
+    NAME_KEYS = ("shortName", "short_name", "name", "model_name", "modelName")
+    
+    # Browser tabs as (data key, tab label, chart name); each is scraped in its
+    # own Chrome instance. The first is the default tab, so it is extracted
+    # even if clicking it fails.
+    TABS = (
+        ("intelligence_index", "Artificial Analysis Intelligence Index", "intelligence"),
+        ("coding_index", "Coding Index", "coding"),
+        ("agentic_index", "Agentic Index", "agentic")
+    )
+    
+    def __init__(self, use_selenium: bool = False):
+        self.drivers = {}
+        self._profile_locks = {}
+        self.use_selenium = use_selenium
+        self.screenshot_path = None
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
     
-    def __init__(self):
-        self.driver = None
+    def _acquire_profile(self, key: str) -> Optional[str]:
+        """Lock and return this tab's persistent Chrome profile directory.
+        
+        Returns None when another monitor process holds the profile, in
+        which case Chrome runs with a throwaway profile.
+        """
+        profile_dir = os.path.abspath(os.path.join(CHROME_PROFILE_DIR, key))
+        if key in self._profile_locks:
+            return profile_dir
+        try:
+            os.makedirs(profile_dir, exist_ok=True)
+            handle = open(os.path.join(profile_dir, "monitor.lock"), "a")
+        except OSError as e:
+            logger.warning(f"Chrome profile unavailable ({e}), using a temporary one")
+            return None
+        if not _try_lock(handle):
+            handle.close()
+            logger.warning(f"Chrome profile {profile_dir} is in use, using a temporary one")
+            return None
+        self._profile_locks[key] = handle
+        return profile_dir
     
-    def _setup_driver(self):
-        """Initialize Chrome in headless mode."""
+    def _release_profile(self, key: str):
+        """Unlock this tab's Chrome profile."""
+        handle = self._profile_locks.pop(key, None)
+        if handle:
+            handle.close()
+    
+    def _setup_driver(self, key: str) -> "webdriver.Chrome":
+        """Launch Chrome in headless mode for one tab."""
         options = Options()
         options.add_argument("--headless=new")
         options.add_argument("--no-sandbox")
@@ -190,141 +273,56 @@ class BenchmarkScraper:
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1200")
         options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.driver.implicitly_wait(10)
-    
-    def _close_driver(self):
-        """Clean up driver."""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-    
-    def _is_model_name(self, text: str) -> bool:
-        """
-        Check if text looks like an AI model name.
-        Uses heuristics instead of keyword matching to handle new/unknown models.
-        """
-        if not text or len(text) < 2 or len(text) > 80:
-            return False
-            
-        text_lower = text.lower().strip()
+        options.add_argument(f"--user-agent={USER_AGENT}")
         
-        # Check if it's UI text to ignore
-        if any(ignore in text_lower for ignore in self.IGNORE_PATTERNS):
-            return False
+        # Only the rendered text is read, so skip image downloads and don't
+        # wait for late subresources before handing control back
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+        options.page_load_strategy = "eager"
         
-        # Reject "X of Y models" patterns (e.g., "25 of 342 models", "25 of 345 models")
-        if re.match(r'^\d+\s+of\s+\d+\s+models?$', text_lower):
-            return False
+        # Keep the HTTP cache (scripts, fonts) between runs
+        profile_dir = self._acquire_profile(key)
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={profile_dir}")
         
-        # Reject common UI patterns
-        if text.startswith(('+', '×', '•', '→', '←', '↑', '↓')):
-            return False
-            
-        # Reject if it's just a number or very short
-        if text.isdigit() or len(text_lower) < 2:
-            return False
-            
-        # Reject if it looks like a sentence (too many spaces, ends with punctuation)
-        if text.count(' ') > 6:
-            return False
-        if text.endswith(('.', '!', '?', ':')):
-            return False
-            
-        # Reject pure URLs
-        if text_lower.startswith(('http://', 'https://', 'www.')):
-            return False
-        
-        # Model names typically have:
-        # - Alphanumeric characters with optional hyphens, underscores, dots
-        # - Version numbers (1.5, 2.0, v2, etc.)
-        # - Size indicators (7B, 70B, etc.)
-        
-        # Check if it matches typical model name patterns
-        # Allow: letters, numbers, spaces, hyphens, underscores, dots, parentheses
-        if not re.match(r'^[\w\s\-\.\(\)]+$', text, re.UNICODE):
-            return False
-        
-        # Must contain at least one letter
-        if not any(c.isalpha() for c in text):
-            return False
-            
-        return True
+        # Selenium Manager resolves and caches the matching ChromeDriver itself.
+        # No implicit wait: find_elements returns immediately when nothing
+        # matches, and every wait below is explicit
+        try:
+            return webdriver.Chrome(options=options)
+        except Exception:
+            self._release_profile(key)
+            raise
     
-    def _is_score(self, text: str) -> Optional[int]:
-        """Check if text is a valid score (10-99)."""
-        if re.match(r'^\d{1,2}$', text.strip()):
-            score = int(text.strip())
-            if 10 <= score <= 99:
-                return score
-        return None
+    def _close_driver(self, key: str):
+        """Clean up the driver for one tab."""
+        driver = self.drivers.pop(key, None)
+        if driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing Chrome: {e}")
+        self._release_profile(key)
     
-    def _extract_chart_data(self, index_type: str = "intelligence") -> List[Dict]:
+    def close(self):
+        """Release the browsers kept alive between scrapes."""
+        for key in list(self.drivers):
+            self._close_driver(key)
+    
+    def _extract_chart_data(self, driver: "webdriver.Chrome", index_type: str = "intelligence") -> List[Dict]:
         """Extract model data from the currently visible chart.
         
         Args:
+            driver: Browser showing the chart
             index_type: One of "intelligence", "coding", or "agentic"
         """
         models = []
         try:
             # Get page text
-            body = self.driver.find_element(By.TAG_NAME, "body")
-            page_text = body.text
-            lines = page_text.split('\n')
-            
-            # Find the first "25 of 34X models" marker and extract the chart after it
-            in_chart = False
-            chart_lines = []
-            
-            for i, line in enumerate(lines):
-                line = line.strip()
-                
-                # Look for the models count marker (e.g., "25 of 345 models")
-                if re.match(r'^\d+\s+of\s+\d+\s+models?$', line.lower()):
-                    in_chart = True
-                    continue
-                
-                # Skip "+ Add model" line
-                if in_chart and "+ Add model" in line:
-                    continue
-                
-                # End at JSON schema data
-                if in_chart and '{"@context"' in line:
-                    break
-                    
-                if in_chart and line:
-                    chart_lines.append(line)
-            
-            # Parse chart lines - models come first, then scores
-            names = []
-            scores = []
-            
-            for line in chart_lines:
-                # Skip "Artificial Analysis" label
-                if line == "Artificial Analysis":
-                    continue
-                    
-                score = self._is_score(line)
-                if score:
-                    scores.append(score)
-                elif self._is_model_name(line):
-                    clean = re.sub(r'[\U0001F300-\U0001F9FF]', '', line)
-                    clean = re.sub(r'\s+', ' ', clean).strip()
-                    if clean and len(clean) > 2:
-                        names.append(clean)
-            
-            # Match names with scores (they appear in same order)
-            # Limit to 25 models (the chart shows 25)
-            for i, (name, score) in enumerate(zip(names[:25], scores[:25])):
-                models.append({
-                    "rank": i + 1,
-                    "model": name,
-                    "score": score
-                })
-                
+            body = driver.find_element(By.TAG_NAME, "body")
+            models = parse_chart_text(body.text)
             logger.info(f"Extracted {len(models)} models from {index_type} chart")
             
         except Exception as e:
@@ -332,7 +330,25 @@ class BenchmarkScraper:
             
         return models
     
-    def _click_tab(self, tab_name: str) -> bool:
+    @staticmethod
+    def _body_text(driver: "webdriver.Chrome") -> str:
+        """Return the visible page text."""
+        return driver.find_element(By.TAG_NAME, "body").text
+    
+    def _wait_for_chart_update(self, driver: "webdriver.Chrome", previous_text: str, timeout: float = 3):
+        """Wait until the page text changes after a tab click.
+        
+        Clicking the tab that is already active changes nothing, so a timeout
+        just means the chart is already current.
+        """
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+                lambda d: self._body_text(d) != previous_text
+            )
+        except TimeoutException:
+            pass
+    
+    def _click_tab(self, driver: "webdriver.Chrome", tab_name: str) -> bool:
         """Click on a specific tab (Intelligence Index, Coding Index, Agentic Index)."""
         try:
             # Try different selectors for the tab
@@ -345,11 +361,12 @@ class BenchmarkScraper:
             
             for selector in selectors:
                 try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
+                    elements = driver.find_elements(By.XPATH, selector)
                     for elem in elements:
                         if elem.is_displayed() and elem.is_enabled():
+                            previous_text = self._body_text(driver)
                             elem.click()
-                            time.sleep(2)  # Wait for chart to update
+                            self._wait_for_chart_update(driver, previous_text)
                             logger.info(f"Clicked tab: {tab_name}")
                             return True
                 except:
@@ -362,78 +379,276 @@ class BenchmarkScraper:
             logger.error(f"Error clicking tab {tab_name}: {e}")
             return False
     
-    def scrape(self) -> Dict:
-        """Scrape all benchmark indices by clicking through each tab."""
+    def _get_page(self, headers: Optional[Dict] = None) -> requests.Response:
+        """GET the page, raising ScrapeError on network or HTTP errors."""
         try:
-            logger.info("Starting scrape...")
-            self._setup_driver()
-            
-            # Load page
-            self.driver.get(BASE_URL)
-            time.sleep(8)  # Wait for JS rendering
-            
-            # Scroll down to the Intelligence section
-            self.driver.execute_script("window.scrollTo(0, 800);")
-            time.sleep(2)
-            
-            data = {
-                "intelligence_index": [],
-                "coding_index": [],
-                "agentic_index": []
-            }
-            
-            # Extract Intelligence Index (default tab)
-            logger.info("Extracting Intelligence Index...")
-            self._click_tab("Artificial Analysis Intelligence Index")
-            time.sleep(1)
-            data["intelligence_index"] = self._extract_chart_data("intelligence")
-            
-            # Click Coding Index tab and extract
-            logger.info("Extracting Coding Index...")
-            if self._click_tab("Coding Index"):
-                time.sleep(2)
-                data["coding_index"] = self._extract_chart_data("coding")
+            response = self.session.get(BASE_URL, headers=headers, timeout=30, verify=False)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise ScrapeError(f"Failed to fetch {BASE_URL}: {e}") from e
+        return response
+    
+    def _fetch_html(self) -> str:
+        """Download the raw page HTML."""
+        return self._get_page().text
+    
+    def fetch_if_changed(self, validators: Dict) -> Tuple[Optional[str], Dict]:
+        """Conditionally fetch the page using validators from a previous fetch.
+        
+        Returns (html, validators); html is None when the page is unchanged.
+        Falls back to a hash of the body when the server sends no ETag or
+        Last-Modified header.
+        """
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        
+        response = self._get_page(headers)
+        if response.status_code == 304:
+            logger.info("Page unchanged (304)")
+            return None, validators
+        
+        new_validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+        if not new_validators["etag"] and not new_validators["last_modified"]:
+            new_validators["content_hash"] = hashlib.sha256(response.content).hexdigest()
+            if new_validators["content_hash"] == validators.get("content_hash"):
+                logger.info("Page unchanged (same content hash)")
+                return None, validators
+        return response.text, new_validators
+    
+    def _extract_embedded_json(self, html: str) -> List:
+        """Parse every embedded JSON block (__NEXT_DATA__ and JSON-LD) in the page."""
+        documents = []
+        for pattern in (self.NEXT_DATA_RE, self.JSON_LD_RE):
+            for block in pattern.findall(html):
+                try:
+                    documents.append(_load_json(block))
+                except ValueError:
+                    continue
+        return documents
+    
+    def _model_scores(self, node: Dict) -> Tuple[Optional[str], Dict[str, float]]:
+        """Return (model name, {index: score}) for a dict that looks like a model record."""
+        name = next((node[k] for k in self.NAME_KEYS if isinstance(node.get(k), str)), None)
+        if not name:
+            return None, {}
+        
+        # Scores may sit directly on the record or in a nested, unnamed dict
+        # (e.g. {"name": ..., "evaluations": {"coding_index": 55}})
+        fields = list(node.items())
+        for value in node.values():
+            if isinstance(value, dict) and not any(k in value for k in self.NAME_KEYS):
+                fields.extend(value.items())
+        
+        scores = {}
+        for field, value in fields:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            norm = self._RE_NON_ALPHA.sub('', field.lower())
+            for idx_key, suffix in self.INDEX_KEYS.items():
+                if norm.endswith(suffix):
+                    scores[idx_key] = value
+        return name, scores
+    
+    def _parse_embedded_data(self, documents: List) -> Dict:
+        """Walk the embedded JSON and build the top 25 ranking for each index."""
+        scores = {idx_key: {} for idx_key in self.INDEX_KEYS}
+        queue = deque(documents)  # Breadth-first, in document order: first record wins
+        while queue:
+            node = queue.popleft()
+            if isinstance(node, list):
+                queue.extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+            queue.extend(node.values())
+            
+            name, model_scores = self._model_scores(node)
+            for idx_key, score in model_scores.items():
+                scores[idx_key].setdefault(self._RE_WS.sub(' ', name).strip(), score)
+        
+        data = {}
+        for idx_key, by_model in scores.items():
+            ranked = sorted(by_model.items(), key=lambda item: item[1], reverse=True)[:25]
+            data[idx_key] = [
+                {"rank": i + 1, "model": name, "score": round(score)}
+                for i, (name, score) in enumerate(ranked)
+            ]
+            logger.info(f"Extracted {len(data[idx_key])} models from {idx_key} data")
+        return data
+    
+    def _scrape_http(self, html: Optional[str] = None) -> Dict:
+        """Scrape all benchmark indices from the JSON embedded in the page HTML."""
+        logger.info("Starting HTTP scrape...")
+        if html is None:
+            html = self._fetch_html()
+        
+        # Debug: save page content
+        with open("debug_page.txt", "w", encoding="utf-8") as f:
+            f.write(html)
+        
+        documents = self._extract_embedded_json(html)
+        if not documents:
+            raise ScrapeError("No embedded JSON found in page")
+        
+        # A partial result would read as every model of the missing indices
+        # being removed, so let the browser scraper handle it instead
+        data = self._parse_embedded_data(documents)
+        missing = [idx for idx, models in data.items() if not models]
+        if missing:
+            raise ScrapeError(f"Embedded JSON has no data for {', '.join(missing)}")
+        return self._build_result(data, "http")
+    
+    def _build_result(self, data: Dict, method: str) -> Dict:
+        """Wrap extracted index data with metadata and log a summary."""
+        result = {
+            "timestamp": datetime.now().isoformat(),
+            "source": BASE_URL,
+            "method": method,
+            "data": data
+        }
+        
+        total = sum(len(v) for v in data.values())
+        if total == 0:
+            raise ScrapeError("No benchmark data could be extracted from artificialanalysis.ai")
+        
+        logger.info(f"Scraped {total} total models")
+        for idx, models in data.items():
+            if models:
+                logger.info(f"  {idx}: {len(models)} models (top: {models[0]['model']} @ {models[0]['score']})")
+        
+        return result
+    
+    def _scrape_tab(self, key: str, tab_name: str, index_type: str) -> List[Dict]:
+        """Load the page in this tab's browser, switch to the tab and extract its chart."""
+        driver = self.drivers.get(key)
+        if driver is None:
+            driver = self.drivers[key] = self._setup_driver(key)
+        
+        # Load page and wait for JS rendering
+        driver.get(BASE_URL)
+        WebDriverWait(driver, 20).until(lambda d: "INTELLIGENCE" in self._body_text(d))
+        
+        # Scroll down to the Intelligence section and wait for the chart
+        driver.execute_script("window.scrollTo(0, 800);")
+        WebDriverWait(driver, 10).until(lambda d: self._RE_MODELS_MARKER.search(self._body_text(d)))
+        
+        logger.info(f"Extracting {tab_name}...")
+        if not self._click_tab(driver, tab_name) and key != self.TABS[0][0]:
+            return []
+        return self._extract_chart_data(driver, index_type)
+    
+    def _scrape_browser(self) -> Dict:
+        """Scrape all benchmark indices, one browser per tab in parallel."""
+        try:
+            logger.info("Starting Selenium scrape...")
             
-            # Click Agentic Index tab and extract  
-            logger.info("Extracting Agentic Index...")
-            if self._click_tab("Agentic Index"):
-                time.sleep(2)
-                data["agentic_index"] = self._extract_chart_data("agentic")
+            with ThreadPoolExecutor(max_workers=len(self.TABS)) as pool:
+                futures = {key: pool.submit(self._scrape_tab, key, tab_name, index_type)
+                           for key, tab_name, index_type in self.TABS}
+                data = {key: future.result() for key, future in futures.items()}
             
-            # Take final combined screenshot
-            self.driver.execute_script("window.scrollTo(0, 600);")
+            # Take screenshot of the default tab
+            driver = self.drivers[self.TABS[0][0]]
+            driver.execute_script("window.scrollTo(0, 600);")
             time.sleep(1)
-            self.driver.save_screenshot("latest_scrape.png")
+            driver.save_screenshot(SCREENSHOT_FILE)
+            self.screenshot_path = SCREENSHOT_FILE
             
             # Debug: save page content
-            body = self.driver.find_element(By.TAG_NAME, "body")
             with open("debug_page.txt", "w", encoding="utf-8") as f:
-                f.write(body.text)
-            
-            result = {
-                "timestamp": datetime.now().isoformat(),
-                "source": BASE_URL,
-                "data": data
-            }
-            
-            total = sum(len(v) for v in data.values())
-            if total == 0:
-                raise ScrapeError("No benchmark data could be extracted from artificialanalysis.ai")
-            
-            logger.info(f"Scraped {total} total models")
-            for idx, models in data.items():
-                if models:
-                    logger.info(f"  {idx}: {len(models)} models (top: {models[0]['model']} @ {models[0]['score']})")
+                f.write(self._body_text(driver))
             
-            return result
+            return self._build_result(data, "selenium")
             
         except ScrapeError:
             raise
+        except TimeoutException as e:
+            # Slow page or missing marker: the browsers are fine, keep them
+            logger.error(f"Timed out waiting for the page: {e.msg}")
+            raise ScrapeError("Timed out waiting for benchmark data") from e
+        except WebDriverException as e:
+            # Drop the broken sessions so the next attempt relaunches Chrome
+            logger.error(f"Browser error: {e.msg}")
+            self.close()
+            raise ScrapeError("Failed to retrieve benchmark data") from e
         except Exception as e:
             logger.error(f"Scrape failed: {e}", exc_info=True)
             raise ScrapeError("Failed to retrieve benchmark data") from e
-        finally:
-            self._close_driver()
+    
+    def _scrape_selenium(self) -> Dict:
+        """Scrape with the persistent browsers, relaunching once if a session died."""
+        if self.drivers:
+            try:
+                return self._scrape_browser()
+            except ScrapeError as e:
+                cause = e.__cause__
+                if not isinstance(cause, WebDriverException) or isinstance(cause, TimeoutException):
+                    raise
+                logger.warning("Reused browser session failed, relaunching Chrome...")
+        return self._scrape_browser()
+    
+    def scrape(self, html: Optional[str] = None) -> Dict:
+        """Scrape all benchmark indices.
+        
+        Reads the data embedded in the page HTML (fetching it unless already
+        provided) and only falls back to a headless browser when that fails
+        (or when forced with --selenium).
+        """
+        self.screenshot_path = None
+        if not self.use_selenium:
+            try:
+                return self._scrape_http(html)
+            except ScrapeError as e:
+                logger.warning(f"HTTP scrape failed ({e}), falling back to Selenium")
+        return self._scrape_selenium()
+
+# ============================================================================
+# HISTORY
+# ============================================================================
+
+def load_history(limit: int = 500) -> List[Dict]:
+    """Return the last `limit` snapshots from the history file, oldest first."""
+    if not os.path.exists(HISTORY_FILE):
+        return []
+    with open(HISTORY_FILE, 'rb') as f:
+        return [_load_json(line) for line in deque(f, maxlen=limit) if line.strip()]
+
+
+def _migrate_legacy_history():
+    """Convert the old JSON-array history file to JSON Lines."""
+    if not os.path.exists(LEGACY_HISTORY_FILE) or os.path.exists(HISTORY_FILE):
+        return
+    try:
+        with open(LEGACY_HISTORY_FILE, 'rb') as f:
+            history = _load_json(f.read())
+        with open(HISTORY_FILE, 'wb') as f:
+            for entry in history:
+                f.write(_dump_json(entry) + b'\n')
+        os.remove(LEGACY_HISTORY_FILE)
+        logger.info(f"Migrated {len(history)} entries from {LEGACY_HISTORY_FILE} to {HISTORY_FILE}")
+    except Exception as e:
+        logger.error(f"History migration failed: {e}")
+
+
+def _rotate_history():
+    """Move the history file aside with a date suffix once it grows too large."""
+    if os.path.exists(HISTORY_FILE) and os.path.getsize(HISTORY_FILE) > HISTORY_MAX_BYTES:
+        base, ext = os.path.splitext(HISTORY_FILE)
+        stamp = datetime.now().strftime('%Y-%m-%d')
+        rotated = f"{base}-{stamp}{ext}"
+        suffix = 1
+        while os.path.exists(rotated):  # Never overwrite an earlier rotation
+            rotated = f"{base}-{stamp}.{suffix}{ext}"
+            suffix += 1
+        os.replace(HISTORY_FILE, rotated)
+        logger.info(f"Rotated history to {rotated}")
 
 # ============================================================================
 # MONITOR
@@ -442,41 +657,116 @@ class BenchmarkScraper:
 class BenchmarkMonitor:
     """Monitors for benchmark changes and sends alerts."""
     
-    def __init__(self):
-        self.scraper = BenchmarkScraper()
+    def __init__(self, use_selenium: bool = False):
+        self.scraper = BenchmarkScraper(use_selenium=use_selenium)
+        self._page_state = self._load_page_state()
+        _migrate_legacy_history()
+        
+        # Hash of the saved index data, to skip rewriting identical results
+        saved = self._load_data()
+        self._last_hash = self._data_hash(saved) if saved else None
+        
+        # Pushover calls run on a background thread so a check never blocks
+        # on the notification round trip
+        self._notifier = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pushover")
+        self._pending_notifications: List[Future] = []
+        # Message of the first failed send since the last flush; kept as text so
+        # the exception's traceback (and any screenshot bytes) can be freed
+        self._failed_notification: Optional[str] = None
+    
+    def close(self):
+        """Shut down the scraper's browser and finish sending notifications."""
+        self.scraper.close()
+        self._notifier.shutdown(wait=True)
+    
+    def _notify(self, title: str, message: str, priority: int = 0, image_path: str = None):
+        """Queue a Pushover notification on the background sender thread."""
+        # Forget finished sends; failures are recorded by the done-callback
+        self._pending_notifications = [f for f in self._pending_notifications if not f.done()]
+        future = self._notifier.submit(send_pushover, title, message, priority, image_path)
+        future.add_done_callback(self._log_notification_failure)
+        self._pending_notifications.append(future)
+    
+    def _log_notification_failure(self, future: Future):
+        """Log a failed send as soon as it finishes and remember the first one."""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"❌ {error}")
+            if self._failed_notification is None:
+                self._failed_notification = str(error)
+    
+    def flush_notifications(self):
+        """Wait for queued notifications; raise the first failure since the last flush."""
+        wait(self._pending_notifications)
+        self._pending_notifications = []
+        failure, self._failed_notification = self._failed_notification, None
+        if failure is not None:
+            raise PushoverError(failure)
+    
+    def _load_page_state(self) -> Dict:
+        """Load HTTP validators saved by the last successful check."""
+        try:
+            if os.path.exists(PAGE_STATE_FILE):
+                with open(PAGE_STATE_FILE, 'rb') as f:
+                    return _load_json(f.read())
+        except Exception as e:
+            logger.error(f"Page state load failed: {e}")
+        return {}
+    
+    def _save_page_state(self, state: Dict):
+        """Persist HTTP validators for the next conditional fetch.
+        
+        Only rewritten when the state changed, but always present after a
+        successful check (an empty state just forces a full fetch next time).
+        """
+        if state == self._page_state and os.path.exists(PAGE_STATE_FILE):
+            return
+        self._page_state = state
+        try:
+            with open(PAGE_STATE_FILE, 'wb') as f:
+                f.write(_dump_json(state, indent=True))
+        except Exception as e:
+            logger.error(f"Page state save failed: {e}")
+    
+    @staticmethod
+    def _data_hash(data: Dict) -> bytes:
+        """Hash the index data and scrape method of a snapshot (ignoring its timestamp).
+        
+        The method is part of the hash so a switch between scrapers is saved
+        (and re-baselined by _compare) even when the rankings look the same.
+        """
+        key = {"method": data.get("method", "selenium"), "data": data.get("data", {})}
+        return hashlib.blake2b(_dump_json(key), digest_size=16).digest()
     
     def _load_data(self) -> Optional[Dict]:
         """Load saved data."""
         try:
             if os.path.exists(DATA_FILE):
-                with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(DATA_FILE, 'rb') as f:
+                    return _load_json(f.read())
         except Exception as e:
             logger.error(f"Load failed: {e}")
         return None
     
-    def _save_data(self, data: Dict):
-        """Save data to file."""
+    def _save_data(self, data: Dict) -> bool:
+        """Save data to file. Returns False if the data file couldn't be written."""
         try:
-            with open(DATA_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved to {DATA_FILE}")
-            
-            # Append to history
-            history = []
-            if os.path.exists(HISTORY_FILE):
-                try:
-                    with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                        history = json.load(f)
-                except:
-                    pass
-            history.append(data)
-            history = history[-500:]  # Keep last 500
-            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
-                
+            with open(DATA_FILE, 'wb') as f:
+                f.write(_dump_json(data, indent=True))
         except Exception as e:
             logger.error(f"Save failed: {e}")
+            return False
+        self._last_hash = self._data_hash(data)
+        logger.info(f"Saved to {DATA_FILE}")
+        
+        # Append to history
+        try:
+            _rotate_history()
+            with open(HISTORY_FILE, 'ab') as f:
+                f.write(_dump_json(data) + b'\n')
+        except Exception as e:
+            logger.error(f"History save failed: {e}")
+        return True
     
     def _compare(self, old: Dict, new: Dict) -> List[str]:
         """Find differences between old and new data."""
@@ -485,6 +775,15 @@ class BenchmarkMonitor:
         if not old or not new:
             return changes
         
+        # The HTTP and browser scrapers rank different model sets, so a switch
+        # between them only re-baselines (snapshots without "method" predate
+        # the HTTP scraper)
+        old_method = old.get("method", "selenium")
+        new_method = new.get("method", "selenium")
+        if old_method != new_method:
+            logger.info(f"Scrape method changed ({old_method} → {new_method}), re-baselining without alerts")
+            return changes
+        
         index_labels = {
             "intelligence_index": "🧠 Intelligence",
             "coding_index": "💻 Coding", 
@@ -495,27 +794,27 @@ class BenchmarkMonitor:
             old_models = {m["model"]: m for m in old.get("data", {}).get(idx_key, [])}
             new_models = {m["model"]: m for m in new.get("data", {}).get(idx_key, [])}
             
-            # New models
-            for name, data in new_models.items():
-                if name not in old_models:
-                    changes.append(f"🆕 {label}: {name} (#{data['rank']}, score {data['score']})")
+            added = new_models.keys() - old_models.keys()
+            removed = old_models.keys() - new_models.keys()
+            
+            # New models (in rank order)
+            changes.extend(
+                f"🆕 {label}: {name} (#{data['rank']}, score {data['score']})"
+                for name, data in new_models.items() if name in added
+            )
             
             # Removed models
-            for name in old_models:
-                if name not in new_models:
-                    changes.append(f"❌ {label}: {name} removed")
+            changes.extend(f"❌ {label}: {name} removed" for name in old_models if name in removed)
             
-            # Rank changes (top 15 only)
+            # Rank changes (top 15 only), single pass over models in both snapshots
             for name, new_data in new_models.items():
-                if name in old_models:
-                    old_data = old_models[name]
-                    old_rank = old_data.get("rank", 0)
-                    new_rank = new_data.get("rank", 0)
-                    
-                    if old_rank != new_rank and (old_rank <= 15 or new_rank <= 15):
-                        diff = old_rank - new_rank
-                        arrow = "📈" if diff > 0 else "📉"
-                        changes.append(f"{arrow} {label}: {name} #{old_rank}→#{new_rank}")
+                if name in added:
+                    continue
+                old_rank = old_models[name].get("rank", 0)
+                new_rank = new_data.get("rank", 0)
+                if old_rank != new_rank and (old_rank <= 15 or new_rank <= 15):
+                    arrow = "📈" if old_rank > new_rank else "📉"
+                    changes.append(f"{arrow} {label}: {name} #{old_rank}→#{new_rank}")
         
         return changes
     
@@ -524,18 +823,38 @@ class BenchmarkMonitor:
         logger.info("=" * 50)
         logger.info(f"Checking at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
+        # Skip the scrape entirely when the page hasn't changed since the last check
+        html = None
+        page_state = {}
+        try:
+            html, page_state = self.scraper.fetch_if_changed(self._page_state)
+        except ScrapeError as e:
+            logger.warning(f"Conditional fetch failed: {e}")
+        if html is None and page_state and os.path.exists(DATA_FILE):
+            logger.info("✓ No changes (page not modified, skipped scrape)")
+            return False, []
+        
         # Scrape
-        new_data = self.scraper.scrape()
+        new_data = self.scraper.scrape(html=html)
         total = sum(len(new_data.get("data", {}).get(k, [])) for k in ["intelligence_index", "coding_index", "agentic_index"])
         logger.info(f"Latest scrape captured {total} models across tracked indices")
         
+        # Identical to the saved data: nothing to compare, save or record
+        if self._data_hash(new_data) == self._last_hash and os.path.exists(DATA_FILE):
+            logger.info("✓ No changes (identical data, skipped save)")
+            self._save_page_state(page_state)
+            return False, []
+        
         # Load old data
         old_data = self._load_data()
         
         if old_data is None:
             # First run
             logger.info(f"First run - saving initial state for {total} models")
-            self._save_data(new_data)
+            # Keep the old validators if the data wasn't saved, so the next
+            # check scrapes again instead of getting a 304
+            if self._save_data(new_data):
+                self._save_page_state(page_state)
             #send_pushover(
             #    "🤖 Benchmark Monitor Started",
             #    f"Tracking {total} models.\nMonitoring Intelligence, Coding & Agentic indices.",
@@ -545,7 +864,8 @@ class BenchmarkMonitor:
         
         # Compare
         changes = self._compare(old_data, new_data)
-        self._save_data(new_data)
+        if self._save_data(new_data):
+            self._save_page_state(page_state)
         
         if changes:
             logger.info(f"🚨 {len(changes)} changes detected!")
@@ -556,7 +876,7 @@ class BenchmarkMonitor:
             msg = "\n".join(changes[:10])
             if len(changes) > 10:
                 msg += f"\n+{len(changes)-10} more..."
-            send_pushover("🚨 Benchmark Changes!", msg, priority=1, image_path="latest_scrape.png")
+            self._notify("🚨 Benchmark Changes!", msg, priority=1, image_path=self.scraper.screenshot_path)
         else:
             logger.info("✓ No changes")
         
@@ -566,11 +886,17 @@ class BenchmarkMonitor:
 # MAIN
 # ============================================================================
 
-def run_continuous(interval: int = SCRAPE_INTERVAL_MINUTES):
-    """Run monitor continuously."""
-    import schedule
+def _handle_sigterm(signum, frame):
+    """Turn SIGTERM into a normal exit so cleanup handlers run."""
+    raise SystemExit(0)
+
+def run_continuous(interval: int = SCRAPE_INTERVAL_MINUTES, use_selenium: bool = False):
+    """Run monitor continuously at a fixed cadence."""
+    if interval < 1:
+        raise ValueError(f"Interval must be at least 1 minute, got {interval}")
     
-    monitor = BenchmarkMonitor()
+    monitor = BenchmarkMonitor(use_selenium=use_selenium)
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     
     print("\n" + "=" * 60)
     print("  Artificial Analysis Benchmark Monitor")
@@ -578,32 +904,42 @@ def run_continuous(interval: int = SCRAPE_INTERVAL_MINUTES):
     print("  Press Ctrl+C to stop")
     print("=" * 60 + "\n")
     
-    # Initial check
-    monitor.check()
-    
-    # Schedule
-    schedule.every(interval).minutes.do(monitor.check)
-    
+    period = interval * 60
+    next_run = time.monotonic()
     try:
         while True:
-            schedule.run_pending()
-            time.sleep(30)
+            monitor.check()
+            
+            # Sleep once until the next tick; if a check overran the interval,
+            # skip the missed ticks instead of running them back to back
+            next_run += period
+            now = time.monotonic()
+            if next_run < now:
+                next_run += ((now - next_run) // period + 1) * period
+            time.sleep(next_run - now)
     except KeyboardInterrupt:
         print("\n\nMonitor stopped.")
+    finally:
+        monitor.close()
 
-def run_once():
+def run_once(use_selenium: bool = False):
     """Single check."""
-    monitor = BenchmarkMonitor()
-    has_changes, changes = monitor.check()
-    
-    print("\n" + "=" * 50)
-    if has_changes:
-        print("CHANGES:")
-        for c in changes:
-            print(f"  {c}")
-    else:
-        print("No changes (or first run)")
-    print("=" * 50 + "\n")
+    monitor = BenchmarkMonitor(use_selenium=use_selenium)
+    try:
+        has_changes, changes = monitor.check()
+        
+        print("\n" + "=" * 50)
+        if has_changes:
+            print("CHANGES:")
+            for c in changes:
+                print(f"  {c}")
+        else:
+            print("No changes (or first run)")
+        print("=" * 50 + "\n")
+        
+        monitor.flush_notifications()
+    finally:
+        monitor.close()
 
 if __name__ == "__main__":
     import argparse
@@ -612,8 +948,12 @@ if __name__ == "__main__":
     parser.add_argument("--once", action="store_true", help="Run once and exit")
     parser.add_argument("--interval", type=int, default=SCRAPE_INTERVAL_MINUTES, 
                         help=f"Check interval in minutes (default: {SCRAPE_INTERVAL_MINUTES})")
+    parser.add_argument("--selenium", action="store_true",
+                        help="Always scrape with headless Chrome instead of the page's embedded JSON")
     
     args = parser.parse_args()
+    if args.interval < 1:
+        parser.error("--interval must be at least 1 minute")
     
     # Validate Pushover credentials before starting
     try:
@@ -623,6 +963,6 @@ if __name__ == "__main__":
         raise
     
     if args.once:
-        run_once()
+        run_once(use_selenium=args.selenium)
     else:
-        run_continuous(args.interval)
+        run_continuous(args.interval, use_selenium=args.selenium)
@@ -0,0 +1,41 @@
+"""Checks for the browser fallback's chart text parser."""
+
+from chart_parser import is_score, parse_chart_text
+
+CHART_TEXT = """
+Artificial Analysis Intelligence Index
+Leaderboard
+3 of 342 models
++ Add model
+Artificial Analysis
+Scores are aggregated across all of the evaluations we run today.
+GPT-5.2 (xhigh)
+Gemini 3 Pro 🚀
+Claude Opus 4.5
+51
+49
+48
+{"@context": "https://schema.org", "@type": "Dataset"}
+Grok 5
+60
+"""
+
+
+def test_parse_chart_text_ranks_models_after_marker():
+    assert parse_chart_text(CHART_TEXT) == [
+        {"rank": 1, "model": "GPT-5.2 (xhigh)", "score": 51},
+        {"rank": 2, "model": "Gemini 3 Pro", "score": 49},
+        {"rank": 3, "model": "Claude Opus 4.5", "score": 48}
+    ]
+
+
+def test_parse_chart_text_limit():
+    assert [m["model"] for m in parse_chart_text(CHART_TEXT, limit=2)] == ["GPT-5.2 (xhigh)", "Gemini 3 Pro"]
+
+
+def test_parse_chart_text_needs_marker():
+    assert parse_chart_text("GPT-5.2 (xhigh)\n51\n") == []
+
+
+def test_is_score_bounds():
+    assert [is_score(t) for t in ("9", "10", " 99 ", "100", "4.5")] == [None, 10, 99, None, None]
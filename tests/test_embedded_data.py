@@ -0,0 +1,65 @@
+"""Checks for the embedded-JSON scraper and the scrape-method re-baseline."""
+
+import os
+
+import pytest
+
+from monitor import BenchmarkMonitor, BenchmarkScraper, ScrapeError
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "next_data.html")
+
+
+@pytest.fixture
+def html():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_parse_embedded_data_ranks_each_index(html):
+    scraper = BenchmarkScraper()
+    data = scraper._parse_embedded_data(scraper._extract_embedded_json(html))
+    
+    assert data["intelligence_index"] == [
+        {"rank": 1, "model": "GPT-5.2 (xhigh)", "score": 51},
+        {"rank": 2, "model": "Claude Opus 4.5", "score": 49},
+        {"rank": 3, "model": "Gemini 3 Pro Preview (high)", "score": 48}
+    ]
+    assert [m["model"] for m in data["coding_index"]] == [
+        "Claude Opus 4.5", "GPT-5.2 (xhigh)", "Gemini 3 Pro Preview (high)"
+    ]
+    assert [m["score"] for m in data["agentic_index"]] == [62, 60, 55]
+
+
+def test_scrape_http_tags_method(html, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = BenchmarkScraper()._scrape_http(html)
+    assert result["method"] == "http"
+
+
+def test_scrape_http_rejects_partial_data(html, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    partial = html.replace("codingIndex", "codingRank").replace("artificial_analysis_coding_index", "coding_rank")
+    with pytest.raises(ScrapeError, match="coding_index"):
+        BenchmarkScraper()._scrape_http(partial)
+
+
+def test_compare_rebaselines_when_method_changes():
+    old = {"data": {"coding_index": [{"rank": 1, "model": "A", "score": 50}]}}
+    new = {"method": "http", "data": {"coding_index": [{"rank": 1, "model": "B", "score": 50}]}}
+    monitor = BenchmarkMonitor.__new__(BenchmarkMonitor)
+    
+    assert monitor._compare(old, new) == []
+    assert monitor._compare({**old, "method": "http"}, new) == [
+        "🆕 💻 Coding: B (#1, score 50)",
+        "❌ 💻 Coding: A removed"
+    ]
+
+
+def test_data_hash_includes_method():
+    data = {"coding_index": [{"rank": 1, "model": "A", "score": 50}]}
+    http = {"timestamp": "t1", "method": "http", "data": data}
+    
+    assert BenchmarkMonitor._data_hash(http) == BenchmarkMonitor._data_hash({**http, "timestamp": "t2"})
+    assert BenchmarkMonitor._data_hash(http) != BenchmarkMonitor._data_hash({**http, "method": "selenium"})
+    # Legacy snapshots without a method count as selenium ones
+    assert BenchmarkMonitor._data_hash({"data": data}) == BenchmarkMonitor._data_hash({**http, "method": "selenium"})